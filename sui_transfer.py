@@ -7,76 +7,271 @@
 - 用完立即清除内存
 """
 
+import ctypes
 import json
 import sys
 import os
-import hashlib
+import tempfile
+import time
+from collections import OrderedDict
 import base64
+import binascii
+import importlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+# keyring / nacl / bech32 / requests 按需导入（见 require）。--dry-run 从不加载 nacl；
+# 发送方地址已缓存在 .wallet_addresses.json 时也不加载 keyring
+
+# 与 wallet_panel 共用签名方案标志表、哈希与 bech32 解包实现（wallet_panel 顶层只导入标准库）
+from wallet_panel import _SCHEME_FLAG, blake2b_256, bech32_5to8
 
 try:
-    import keyring
-    import bech32
-    from nacl.signing import SigningKey
-    import requests
-except ImportError as e:
-    print(f"❌ 缺少依赖: {e}")
-    print("运行: pip install keyring pynacl bech32 requests")
-    sys.exit(1)
+    # orjson 编解码比标准库 json 快数倍，dry-run 返回可达数十 KB
+    import orjson
+except ImportError:
+    orjson = None
 
 SERVICE_ID = "openclaw_bot"
+ADDR_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".wallet_addresses.json")
 SUI_RPC = "https://fullnode.mainnet.sui.io:443"
+MIN_GAS_BUDGET = 5_000_000
+GAS_BUDGET_UNITS = 5_000  # 预算 = 参考 gas 价格 × 单位数，且不低于 MIN_GAS_BUDGET
+
+# 交易签名 intent 前缀 (TransactionData, V0, Sui)
+INTENT_PREFIX = b"\x00\x00\x00"
+
+_SESSION = None
+# 节点不支持批量请求时，用线程池并发发出独立调用（共用同一个 Session）
+_EXEC = ThreadPoolExecutor(max_workers=2)
 
 # ─── SuiNS 解析 ───────────────────────────────────────────────
 
+SUINS_TTL = 300  # 秒
+SUINS_CACHE_SIZE = 256
+_suins_cache = OrderedDict()  # 小写域名 -> (解析时间, 地址)
+
+
+def cached_suins(name: str) -> str:
+    """返回 TTL 内缓存的域名解析结果，没有则返回 None"""
+    key = name.lower()
+    entry = _suins_cache.get(key)
+    if entry is None:
+        return None
+    ts, address = entry
+    if time.monotonic() - ts >= SUINS_TTL:
+        del _suins_cache[key]
+        return None
+    _suins_cache.move_to_end(key)
+    return address
+
+
+def cache_suins(name: str, address: str):
+    """记录域名解析结果，超出容量时淘汰最久未用的条目"""
+    key = name.lower()
+    _suins_cache[key] = (time.monotonic(), address)
+    _suins_cache.move_to_end(key)
+    while len(_suins_cache) > SUINS_CACHE_SIZE:
+        _suins_cache.popitem(last=False)
+
+
 def resolve_suins(name: str) -> str:
-    """解析 .sui 域名为地址，失败则返回 None"""
+    """解析 .sui 域名为地址（带 TTL 缓存），失败则返回 None"""
+    address = cached_suins(name)
+    if address:
+        return address
     try:
         result = rpc_call("suix_resolveNameServiceAddress", [name])
-        return result
     except Exception:
         return None
+    if result:
+        cache_suins(name, result)
+    return result
 
 # ─── 基础工具 ──────────────────────────────────────────────────
 
+def require(module: str):
+    """按需导入依赖，缺失时提示安装方式并退出"""
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        print(f"❌ 缺少依赖: {e}")
+        print("运行: pip install keyring pynacl bech32 requests")
+        sys.exit(1)
+
+
+_AMOUNT_RE = re.compile(r"\d*\.?\d*", re.ASCII)
+
+
+def sui_to_mist(amount_sui) -> int:
+    """SUI 金额转 MIST，按十进制字符串做整数运算（0.1 SUI 必须正好是 100000000 MIST）
+    小数超过 9 位（MIST 精度）或金额不为正时报错，绝不截断成另一个金额"""
+    text = str(amount_sui).strip()
+    if text in ("", ".") or not _AMOUNT_RE.fullmatch(text):
+        raise ValueError(f"无效金额: {amount_sui}")
+    whole, _, frac = text.partition(".")
+    if len(frac) > 9:
+        raise ValueError(f"金额精度超过 9 位小数: {amount_sui}")
+    mist = int(whole or "0") * 1_000_000_000 + int(frac.ljust(9, "0"))
+    if mist <= 0:
+        raise ValueError(f"金额必须大于 0: {amount_sui}")
+    return mist
+
+
+def mist_to_sui(amount_mist: int) -> str:
+    """MIST 转为不丢精度的 SUI 十进制字符串"""
+    whole, frac = divmod(amount_mist, 1_000_000_000)
+    return f"{whole}.{frac:09d}".rstrip("0").rstrip(".")
+
+
+def json_dumps(obj, indent: bool = False) -> bytes:
+    """JSON 编码为 UTF-8 bytes（优先 orjson，回退标准库）"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def json_loads(data):
+    """解析 JSON bytes/str（优先 orjson，回退标准库）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# PyBytesObject 中 ob_sval 的固定偏移（__basicsize__ 含 1 字节结尾 NUL）
+_BYTES_DATA_OFFSET = bytes.__basicsize__ - 1
+# 紧凑 ASCII str 的字符数据紧跟 PyASCIIObject 头；空串不带任何缓存缓冲区，可据此取头大小
+_STR_DATA_OFFSET = sys.getsizeof("") - 1
+
+
+def wipe_bytes(buf):
+    """尽力清零密钥缓冲区：bytes 不可变，用 ctypes 改写 CPython 对象内存。
+    只能用于本模块独占的缓冲区（别处共享的对象会被一起改掉）"""
+    if type(buf) is bytes and len(buf) > 1:
+        ctypes.memset(id(buf) + _BYTES_DATA_OFFSET, 0, len(buf))
+
+
+def wipe_str(text):
+    """尽力清零 Keychain 返回的私钥字符串。仅处理紧凑 ASCII str（bech32 私钥即是），
+    其字符数据紧跟对象头之后；同样只能用于本模块独占、未做过 dict 键的字符串"""
+    if type(text) is not str or len(text) <= 1 or not text.isascii():
+        return
+    address = id(text) + _STR_DATA_OFFSET
+    # isascii() 不保证紧凑布局：先确认该偏移处确实是字符数据再写
+    if ctypes.string_at(address, len(text)) == text.encode("ascii"):
+        ctypes.memset(address, 0, len(text))
+
+
+def wipe_signing_key(sk):
+    """清零 SigningKey 内部的种子和私钥（PyNaCl 以 bytes 保存，清零后该对象不可再用）"""
+    if sk is None:
+        return
+    wipe_bytes(getattr(sk, "_seed", None))
+    wipe_bytes(getattr(sk, "_signing_key", None))
+
+
 def get_address_from_key(privkey_bech32: str) -> tuple:
-    """返回 (seed_bytes, scheme, pk_bytes, address_hex)"""
+    """返回 (signing_key, pk_bytes, scheme, address_hex)"""
+    bech32 = require("bech32")
+    SigningKey = require("nacl.signing").SigningKey
+
     hrp, data5bit = bech32.bech32_decode(privkey_bech32)
-    data8bit = bytes(bech32.convertbits(data5bit, 5, 8, False))
-    scheme = data8bit[0]
-    seed = data8bit[1:33]
+    data8bit = bech32_5to8(data5bit)
+    try:
+        scheme = data8bit[0]
+        if scheme >= len(_SCHEME_FLAG):
+            raise ValueError(f"不支持的签名方案标志: {scheme}")
+        # 切片生成新的 bytes，由 SigningKey 持有，用完后经 wipe_signing_key 清零
+        sk = SigningKey(data8bit[1:33])
+        pk = sk.verify_key.encode()
+    finally:
+        wipe_bytes(data8bit)
 
-    sk = SigningKey(seed)
-    pk = sk.verify_key.encode()
+    address = "0x" + blake2b_256(_SCHEME_FLAG[scheme] + pk).hex()
 
-    hasher = hashlib.blake2b(digest_size=32)
-    hasher.update(bytes([scheme]) + pk)
-    address = "0x" + hasher.hexdigest()
+    return sk, pk, scheme, address
 
-    return seed, scheme, pk, address
+
+def get_session():
+    """懒加载 requests，复用同一个 Session（一次转账的多个 RPC 只握手一次）"""
+    global _SESSION
+    if _SESSION is None:
+        requests = require("requests")
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        _SESSION = requests.Session()
+        _SESSION.headers["Content-Type"] = "application/json"
+        # Retry 默认不重试 POST 的读错误，只重试连接失败，不会重复提交交易
+        retry = Retry(total=2, backoff_factor=0.2)
+        _SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    return _SESSION
 
 
 def rpc_call(method: str, params: list):
     """调用 Sui JSON-RPC"""
     payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
-    r = requests.post(SUI_RPC, json=payload, timeout=15)
-    result = r.json()
+    r = get_session().post(SUI_RPC, data=json_dumps(payload), timeout=15)
+    result = json_loads(r.content)
     if "error" in result:
         raise Exception(f"RPC error: {result['error']}")
     return result["result"]
 
 
-def get_coins(address: str):
-    """获取地址的 SUI coins"""
-    return rpc_call("suix_getCoins", [address, "0x2::sui::SUI", None, 10])
+def rpc_batch(calls: list) -> list:
+    """一次 HTTP 请求批量调用 Sui JSON-RPC，calls 为 [(method, params), ...]，按顺序返回结果"""
+    payload = [
+        {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+        for i, (method, params) in enumerate(calls)
+    ]
+    r = get_session().post(SUI_RPC, data=json_dumps(payload), timeout=15)
+    responses = json_loads(r.content)
+    if isinstance(responses, dict):
+        # 节点拒绝批量请求时返回单个错误对象，退回并发单独调用
+        futures = [_EXEC.submit(rpc_call, method, params) for method, params in calls]
+        return [f.result() for f in futures]
+    by_id = {resp.get("id"): resp for resp in responses}
+    results = []
+    for i in range(len(calls)):
+        resp = by_id.get(i)
+        if resp is None:
+            raise Exception(f"RPC error: missing response for {calls[i][0]}")
+        if "error" in resp:
+            raise Exception(f"RPC error: {resp['error']}")
+        results.append(resp["result"])
+    return results
+
+
+def get_coins_call(address: str) -> tuple:
+    """获取地址 SUI coins 的 RPC 调用，供 rpc_batch 使用"""
+    return "suix_getCoins", [address, "0x2::sui::SUI", None, 10]
+
+
+def get_coins_and_gas_price(address: str) -> tuple:
+    """同一次往返获取 SUI coins 和参考 gas 价格，返回 (coins, gas_price)"""
+    coins, gas_price = rpc_batch([
+        get_coins_call(address),
+        ("suix_getReferenceGasPrice", []),
+    ])
+    return coins, int(gas_price)
+
+
+def estimate_gas_budget(gas_price: int) -> int:
+    """根据参考 gas 价格估算 gas 预算"""
+    return max(MIN_GAS_BUDGET, gas_price * GAS_BUDGET_UNITS)
 
 
 def build_transfer_tx(sender: str, recipient: str, amount: int, coin_id: str, gas_budget: int):
     """构建转账交易（不签名）"""
+    return build_pay_tx(sender, [recipient], [amount], coin_id, gas_budget)
+
+
+def build_pay_tx(sender: str, recipients: list, amounts: list, coin_id: str, gas_budget: int):
+    """构建一笔向多个地址付款的交易（不签名）"""
     result = rpc_call("unsafe_paySui", [
         sender,
         [coin_id],
-        [recipient],
-        [str(amount)],
+        recipients,
+        [str(a) for a in amounts],
         str(gas_budget)
     ])
     return result
@@ -89,8 +284,9 @@ def dry_run(tx_bytes_b64: str) -> dict:
     return rpc_call("sui_dryRunTransactionBlock", [tx_bytes_b64])
 
 
-def print_dry_run(result: dict, sender: str, recipient: str, amount_sui: float):
-    """格式化显示 Dry Run 结果"""
+def print_dry_run(result: dict, sender: str, recipient, amount_sui):
+    """格式化显示 Dry Run 结果。recipient 为单个地址，或批量转账的地址列表"""
+    recipients = {recipient} if isinstance(recipient, str) else set(recipient)
     effects = result.get("effects", {})
     status = effects.get("status", {}).get("status", "unknown")
 
@@ -127,7 +323,7 @@ def print_dry_run(result: dict, sender: str, recipient: str, amount_sui: float):
             # 标记身份
             if addr == sender:
                 label = "你 (发送方)"
-            elif addr == recipient:
+            elif addr in recipients:
                 label = "收款方"
             else:
                 label = addr[:10] + "..." + addr[-4:]
@@ -146,7 +342,7 @@ def print_dry_run(result: dict, sender: str, recipient: str, amount_sui: float):
     print(f"\n  📨 转账摘要:")
     print(f"     发送: {amount_sui} SUI")
     print(f"     Gas:  ~{gas_total / 1e9:.6f} SUI")
-    print(f"     总支出: ~{(amount_sui * 1e9 + gas_total) / 1e9:.6f} SUI")
+    print(f"     总支出: ~{(sui_to_mist(amount_sui) + gas_total) / 1e9:.6f} SUI")
 
     print("=" * 55)
     return True
@@ -154,23 +350,25 @@ def print_dry_run(result: dict, sender: str, recipient: str, amount_sui: float):
 
 # ─── 签名执行 ─────────────────────────────────────────────────
 
-def sign_and_execute(tx_bytes_b64: str, seed: bytes, scheme: int):
-    """签名并执行交易"""
-    tx_bytes = base64.b64decode(tx_bytes_b64)
-
-    intent_prefix = bytes([0, 0, 0])
-    intent_msg = intent_prefix + tx_bytes
+def sign_tx(tx_bytes_b64: str, sk, pk: bytes, scheme: int) -> str:
+    """对交易签名，返回 base64 序列化签名"""
+    tx_bytes = binascii.a2b_base64(tx_bytes_b64)
 
-    hasher = hashlib.blake2b(digest_size=32)
-    hasher.update(intent_msg)
-    digest = hasher.digest()
+    digest = blake2b_256(INTENT_PREFIX + tx_bytes)
 
-    sk = SigningKey(seed)
     signature = sk.sign(digest).signature
-    pk = sk.verify_key.encode()
 
-    sig_bytes = bytes([scheme]) + signature + pk
-    sig_b64 = base64.b64encode(sig_bytes).decode()
+    # flag(1) | Ed25519 签名(64) | 公钥(32)，预分配后按切片写入
+    sig_bytes = bytearray(97)
+    sig_bytes[0] = scheme
+    sig_bytes[1:65] = signature
+    sig_bytes[65:97] = pk
+    return base64.b64encode(sig_bytes).decode("ascii")
+
+
+def sign_and_execute(tx_bytes_b64: str, sk, pk: bytes, scheme: int):
+    """签名并执行交易（复用已构造的 SigningKey，避免重复派生公钥）"""
+    sig_b64 = sign_tx(tx_bytes_b64, sk, pk, scheme)
 
     result = rpc_call("sui_executeTransactionBlock", [
         tx_bytes_b64,
@@ -181,44 +379,92 @@ def sign_and_execute(tx_bytes_b64: str, seed: bytes, scheme: int):
     return result
 
 
+def print_execution_result(result: dict):
+    """格式化显示链上执行结果"""
+    effects = result.get("effects", {})
+    status = effects.get("status", {}).get("status", "unknown")
+    digest = result.get("digest", "unknown")
+
+    gas = effects.get("gasUsed", {})
+    gas_total = (int(gas.get("computationCost", 0)) +
+                 int(gas.get("storageCost", 0)) -
+                 int(gas.get("storageRebate", 0)))
+
+    print(f"\n{'✅' if status == 'success' else '❌'} 最终状态: {status}")
+    print(f"   交易哈希: {digest}")
+    print(f"   Gas 实际: {gas_total / 1e9:.6f} SUI")
+    print(f"   浏览器: https://suiscan.xyz/mainnet/tx/{digest}")
+
+    for bc in result.get("balanceChanges", []):
+        addr = bc["owner"].get("AddressOwner", "?")
+        short = addr[:8] + "..." + addr[-4:]
+        amt = int(bc["amount"])
+        print(f"   {short}: {amt / 1e9:+.9g} SUI")
+
+
 # ─── 主流程 ───────────────────────────────────────────────────
 
-def transfer(wallet_alias: str, recipient: str, amount_sui: float, auto_confirm: bool = False):
-    """执行转账（带 Dry Run 预览）"""
-    amount_mist = int(amount_sui * 1_000_000_000)
+def transfer(wallet_alias: str, recipient: str, amount_sui: str, auto_confirm: bool = False,
+             skip_dry_run: bool = False):
+    """执行转账（带 Dry Run 预览）。amount_sui 为十进制字符串，如 0.1
+    skip_dry_run 仅在 auto_confirm 下生效：调用方已自行预览过，省去一次模拟往返"""
+    return transfer_many(wallet_alias, [(recipient, amount_sui)],
+                         auto_confirm=auto_confirm, skip_dry_run=skip_dry_run)
 
-    # 解析 .sui 域名
-    original_recipient = recipient
-    if recipient.endswith(".sui"):
-        print(f"\n🔍 解析 SuiNS 域名: {recipient}")
-        resolved = resolve_suins(recipient)
-        if not resolved:
-            print(f"❌ 无法解析域名 {recipient}")
-            return None
-        recipient = resolved
-        print(f"   → {recipient}")
 
-    print(f"\n📤 转账请求")
+def transfer_many(wallet_alias: str, items: list, auto_confirm: bool = False,
+                  skip_dry_run: bool = False):
+    """转账给一个或多个收款方：items 为 [(收款地址或.sui域名, 金额SUI), ...]
+
+    只请求一次 Keychain 授权、只派生一次签名密钥。所有收款方合并进同一笔
+    paySui 交易——多笔独立交易会争用同一个 coin 对象的版本，无法同时提交。
+    """
+    if not items:
+        print("❌ 没有转账项")
+        return None
+
+    # 先校验全部金额，再解析域名
+    amounts_mist = [sui_to_mist(amount_sui) for _, amount_sui in items]
+
+    recipients = []
+    for recipient, _ in items:
+        if recipient.endswith(".sui"):
+            print(f"\n🔍 解析 SuiNS 域名: {recipient}")
+            resolved = resolve_suins(recipient)
+            if not resolved:
+                print(f"❌ 无法解析域名 {recipient}")
+                return None
+            print(f"   → {resolved}")
+            recipient = resolved
+        recipients.append(recipient)
+
+    if len(items) == 1:
+        print(f"\n📤 转账请求")
+    else:
+        print(f"\n📤 批量转账请求 ({len(items)} 笔)")
     print(f"   钱包: {wallet_alias}")
-    print(f"   收款: {original_recipient}")
-    if original_recipient != recipient:
-        print(f"   地址: {recipient}")
-    print(f"   金额: {amount_sui} SUI ({amount_mist} MIST)")
+    for (original_recipient, amount_sui), recipient, amount_mist in zip(items, recipients, amounts_mist):
+        print(f"   收款: {original_recipient}")
+        if original_recipient != recipient:
+            print(f"   地址: {recipient}")
+        print(f"   金额: {amount_sui} SUI ({amount_mist} MIST)")
+    total_sui = mist_to_sui(sum(amounts_mist))
     print(f"\n🔐 正在请求 Keychain 授权...")
 
-    # 从 Keychain 获取私钥
-    privkey = keyring.get_password(SERVICE_ID, wallet_alias)
+    # 从 Keychain 获取私钥（整批只授权一次）
+    privkey = require("keyring").get_password(SERVICE_ID, wallet_alias)
     if not privkey:
         print("❌ 无法获取私钥（用户拒绝或钱包不存在）")
         return None
 
+    sk = None
     try:
-        seed, scheme, pk, sender = get_address_from_key(privkey)
+        sk, pk, scheme, sender = get_address_from_key(privkey)
         save_wallet_address(wallet_alias, sender)  # 缓存地址供 dry-run 使用
         print(f"   发送方: {sender}")
 
-        # 获取 coins
-        coins = get_coins(sender)
+        # 获取 coins 和 gas 价格（批量请求，一次往返）
+        coins, gas_price = get_coins_and_gas_price(sender)
         if not coins["data"]:
             print("❌ 没有可用的 SUI coin")
             return None
@@ -230,17 +476,21 @@ def transfer(wallet_alias: str, recipient: str, amount_sui: float, auto_confirm:
 
         # 构建交易
         print("\n⏳ 构建交易中...")
-        tx_result = build_transfer_tx(sender, recipient, amount_mist, coin_id, 5_000_000)
+        tx_result = build_pay_tx(sender, recipients, amounts_mist, coin_id,
+                                 estimate_gas_budget(gas_price))
         tx_bytes = tx_result["txBytes"]
 
         # ★ Dry Run 模拟 ★
-        print("⏳ Dry Run 模拟中...")
-        dry_result = dry_run(tx_bytes)
-        ok = print_dry_run(dry_result, sender, recipient, amount_sui)
+        if skip_dry_run and auto_confirm:
+            print("⏭️  跳过 Dry Run (--skip-dry-run)")
+        else:
+            print("⏳ Dry Run 模拟中...")
+            dry_result = dry_run(tx_bytes)
+            ok = print_dry_run(dry_result, sender, recipients, total_sui)
 
-        if not ok:
-            print("\n🚫 模拟失败，交易已取消")
-            return None
+            if not ok:
+                print("\n🚫 模拟失败，交易已取消")
+                return None
 
         # 确认
         if not auto_confirm:
@@ -253,102 +503,122 @@ def transfer(wallet_alias: str, recipient: str, amount_sui: float, auto_confirm:
 
         # 签名执行
         print("\n✍️  签名并发送中...")
-        result = sign_and_execute(tx_bytes, seed, scheme)
-
-        # 最终结果
-        effects = result.get("effects", {})
-        status = effects.get("status", {}).get("status", "unknown")
-        digest = result.get("digest", "unknown")
-
-        gas = effects.get("gasUsed", {})
-        gas_total = (int(gas.get("computationCost", 0)) +
-                     int(gas.get("storageCost", 0)) -
-                     int(gas.get("storageRebate", 0)))
-
-        print(f"\n{'✅' if status == 'success' else '❌'} 最终状态: {status}")
-        print(f"   交易哈希: {digest}")
-        print(f"   Gas 实际: {gas_total / 1e9:.6f} SUI")
-        print(f"   浏览器: https://suiscan.xyz/mainnet/tx/{digest}")
-
-        for bc in result.get("balanceChanges", []):
-            addr = bc["owner"].get("AddressOwner", "?")
-            short = addr[:8] + "..." + addr[-4:]
-            amt = int(bc["amount"])
-            print(f"   {short}: {amt / 1e9:+.9g} SUI")
-
+        result = sign_and_execute(tx_bytes, sk, pk, scheme)
+        print_execution_result(result)
         return result
 
     finally:
+        wipe_signing_key(sk)
+        wipe_str(privkey)
         privkey = None
-        seed = None
-        del privkey, seed
+        sk = None
+        del privkey, sk
         print("\n🗑️  私钥已从内存清除")
 
 
 # ─── 仅 Dry Run ──────────────────────────────────────────────
 
+_SUI_ADDRESS_RE = re.compile(r"0x[0-9a-f]{64}")
+
+
 def get_wallet_address(wallet_alias: str) -> str:
-    """从钱包注册表获取地址（不需要私钥）"""
-    # 先尝试从 wallet_panel 读取地址
+    """获取钱包地址（不需要私钥）"""
+    # 优先读取转账时验证并缓存的地址文件，不碰 Keychain
+    address = load_wallet_addresses().get(wallet_alias)
+    if address:
+        return address
+
+    # 备用：wallet_panel 注册表（同进程导入；读注册表会访问 Keychain）
+    # 只接受 Sui 钱包且地址格式正确的记录，推导失败时存的是错误提示字符串
     try:
-        import subprocess as sp
-        result = sp.run(
-            [sys.executable, "wallet_panel.py", "list", "--json"],
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))
-        )
-        if result.returncode == 0:
-            wallets = json.loads(result.stdout)
-            for w in wallets:
-                if w.get("alias") == wallet_alias:
-                    return w["address"]
+        import wallet_panel
+        for w in wallet_panel.list_wallets_json():
+            if (w.get("alias") == wallet_alias and w.get("chain") == "sui"
+                    and _SUI_ADDRESS_RE.fullmatch(w.get("address", ""))):
+                return w["address"]
     except Exception:
         pass
 
-    # 备用：用 security 命令非交互式读取地址映射文件
-    addr_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".wallet_addresses.json")
-    if os.path.exists(addr_file):
-        with open(addr_file) as f:
-            addrs = json.loads(f.read())
-            if wallet_alias in addrs:
-                return addrs[wallet_alias]
-
     return None
 
 
+_addr_cache = {"mtime": None, "data": {}}
+
+
+def load_wallet_addresses() -> dict:
+    """读取地址映射文件，文件 mtime 不变时直接返回上次解析的结果"""
+    try:
+        mtime = os.stat(ADDR_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    if mtime != _addr_cache["mtime"]:
+        with open(ADDR_FILE, "rb") as f:
+            _addr_cache["data"] = json_loads(f.read())
+        _addr_cache["mtime"] = mtime
+    return _addr_cache["data"]
+
+
 def save_wallet_address(wallet_alias: str, address: str):
     """缓存钱包地址到本地文件（不含私钥，安全）"""
-    addr_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".wallet_addresses.json")
-    addrs = {}
-    if os.path.exists(addr_file):
-        with open(addr_file) as f:
-            addrs = json.loads(f.read())
+    addrs = load_wallet_addresses()
+    if addrs.get(wallet_alias) == address:
+        return
+    addrs = dict(addrs)
     addrs[wallet_alias] = address
-    with open(addr_file, "w") as f:
-        f.write(json.dumps(addrs, indent=2))
+    # 先写临时文件再原子替换，避免并发读到写了一半的文件
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(ADDR_FILE), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(json_dumps(addrs, indent=True))
+        os.replace(tmp_path, ADDR_FILE)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    _addr_cache["data"] = addrs
+    _addr_cache["mtime"] = os.stat(ADDR_FILE).st_mtime_ns
+
 
+def dry_run_only(wallet_alias: str, recipient: str, amount_sui: str):
+    """只做模拟预览，不签名不执行。不读取私钥；地址未缓存时会读取 Keychain 中的钱包注册表。"""
+    amount_mist = sui_to_mist(amount_sui)
 
-def dry_run_only(wallet_alias: str, recipient: str, amount_sui: float):
-    """只做模拟预览，不签名不执行。不需要 Keychain 授权。"""
-    amount_mist = int(amount_sui * 1_000_000_000)
+    # 获取发送方地址（不需要私钥）
+    sender = get_wallet_address(wallet_alias)
+    if not sender:
+        print(f"❌ 找不到钱包 {wallet_alias} 的地址")
+        print(f"   提示: 首次使用需先执行一次带 --yes 的转账来缓存地址")
+        print(f"   或手动创建 .wallet_addresses.json")
+        sys.exit(1)
 
+    # SuiNS 解析、coins、gas 价格合并为一次批量请求
     original_recipient = recipient
+    calls = [
+        get_coins_call(sender),
+        ("suix_getReferenceGasPrice", []),
+    ]
+    resolved = None
     if recipient.endswith(".sui"):
         print(f"🔍 解析 SuiNS 域名: {recipient}")
-        resolved = resolve_suins(recipient)
+        resolved = cached_suins(recipient)
+        if not resolved:
+            calls.append(("suix_resolveNameServiceAddress", [recipient]))
+    try:
+        results = rpc_batch(calls)
+    except Exception as e:
+        print(f"❌ 查询失败: {e}")
+        sys.exit(1)
+    coins, gas_price = results[0], int(results[1])
+    if len(results) > 2:
+        resolved = results[2]
+        if resolved:
+            cache_suins(recipient, resolved)
+    if recipient.endswith(".sui"):
         if not resolved:
             print(f"❌ 无法解析域名 {recipient}")
             sys.exit(1)
         recipient = resolved
         print(f"   → {recipient}")
 
-    # 获取发送方地址（不需要私钥）
-    sender = get_wallet_address(wallet_alias)
-    if not sender:
-        print(f"❌ 找不到钱包 {wallet_alias} 的地址")
-        print(f"   提示: 首次使用需先执行一次带 --yes 的转账来缓存地址")
-        print(f"   或手动创建 .wallet_addresses.json")
-        sys.exit(1)
-
     print(f"\n📤 转账预览 (Dry Run)")
     print(f"   钱包: {wallet_alias}")
     print(f"   发送方: {sender}")
@@ -357,8 +627,6 @@ def dry_run_only(wallet_alias: str, recipient: str, amount_sui: float):
         print(f"   收款地址: {recipient}")
     print(f"   金额: {amount_sui} SUI ({amount_mist} MIST)")
 
-    # 获取 coins
-    coins = get_coins(sender)
     if not coins["data"]:
         print("❌ 没有可用的 SUI coin")
         sys.exit(1)
@@ -370,7 +638,8 @@ def dry_run_only(wallet_alias: str, recipient: str, amount_sui: float):
 
     # 构建交易
     print("\n⏳ 构建交易中...")
-    tx_result = build_transfer_tx(sender, recipient, amount_mist, coin_id, 5_000_000)
+    tx_result = build_transfer_tx(sender, recipient, amount_mist, coin_id,
+                                  estimate_gas_budget(gas_price))
     tx_bytes = tx_result["txBytes"]
 
     # Dry Run 模拟（不需要签名）
@@ -388,18 +657,24 @@ if __name__ == "__main__":
     args = [a for a in sys.argv[1:] if not a.startswith("--")]
     auto = "--yes" in flags
     dry_only = "--dry-run" in flags
+    skip_dry = "--skip-dry-run" in flags
 
     if len(args) != 3:
         print("用法: python3 sui_transfer.py <钱包别名> <收款地址或.sui域名> <金额SUI> [选项]")
         print("选项:")
         print("  --dry-run  只模拟预览，不执行")
         print("  --yes      跳过确认直接执行")
+        print("  --skip-dry-run  与 --yes 同用，跳过执行前的模拟（调用方已预览过）")
         print("示例:")
         print("  python3 sui_transfer.py sui1 bvlgari.sui 0.01 --dry-run")
         print("  python3 sui_transfer.py sui1 bvlgari.sui 0.01 --yes")
         sys.exit(1)
 
+    if skip_dry and not auto:
+        print("❌ --skip-dry-run 只能与 --yes 同用（交互确认前必须先模拟预览）")
+        sys.exit(1)
+
     if dry_only:
-        dry_run_only(args[0], args[1], float(args[2]))
+        dry_run_only(args[0], args[1], args[2])
     else:
-        transfer(args[0], args[1], float(args[2]), auto_confirm=auto)
+        transfer(args[0], args[1], args[2], auto_confirm=auto, skip_dry_run=skip_dry)
@@ -5,6 +5,8 @@ MiaoWallet MCP Server for OpenClaw
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
+
 import keyring
 from mcp.server.fastmcp import FastMCP
 
@@ -31,9 +33,14 @@ def list_wallets() -> str:
     if not wallets:
         return "📭 没有注册任何钱包。\n请让用户运行: python3 wallet_panel.py add"
 
+    # 注册表新格式为 dict 列表，旧格式为别名字符串列表
+    aliases = [w["alias"] if isinstance(w, dict) else w for w in wallets]
+    # 每次 Keychain 读取都是一次到 securityd 的同步 IPC，并发发出
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        pks = list(ex.map(lambda a: keyring.get_password(SERVICE_ID, a), aliases))
+
     lines = [f"🔐 已注册 {len(wallets)} 个钱包:\n"]
-    for w in wallets:
-        pk = keyring.get_password(SERVICE_ID, w)
+    for w, pk in zip(aliases, pks):
         status = "✅ 可用" if pk else "❌ 不可用"
         preview = f"[{pk[:4]}...]" if pk else ""
         lines.append(f"  • {w} — {status} {preview}")
@@ -3,6 +3,7 @@
 OpenClaw Wallet Control Panel (MiaoWallet)
 Usage:
   python3 wallet_panel.py list          # List wallets
+  python3 wallet_panel.py list --json   # List wallets as JSON
   python3 wallet_panel.py add           # Add wallet
   python3 wallet_panel.py remove <name> # Remove wallet
   python3 wallet_panel.py test <name>   # Test access
@@ -10,18 +11,20 @@ Usage:
   python3 wallet_panel.py export-config # Export config
 """
 
-import keyring
 import getpass
 import argparse
+import functools
 import json
 import hashlib
 import subprocess
 import sys
 import os
-import locale
 
 SERVICE_ID = "openclaw_bot"
 REGISTRY_KEY = "__wallet_registry__"
+LANG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".lang")
+# Sui signature scheme flag bytes (Ed25519, Secp256k1, Secp256r1, MultiSig)
+_SCHEME_FLAG = [bytes([i]) for i in range(4)]
 
 # ── i18n ─────────────────────────────────────────────
 
@@ -118,13 +121,14 @@ STRINGS = {
 def detect_lang() -> str:
     """Detect user language. Checks saved preference first, then env/locale."""
     # Check saved preference
-    lang_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".lang")
     try:
-        if os.path.exists(lang_file):
-            with open(lang_file) as f:
-                saved = f.read().strip()
-            if saved in ("zh", "en"):
-                return saved
+        fd = os.open(LANG_FILE, os.O_RDONLY)
+        try:
+            saved = os.read(fd, 16).decode().strip()
+        finally:
+            os.close(fd)
+        if saved in ("zh", "en"):
+            return saved
     except Exception:
         pass
     # Fallback to env/locale
@@ -133,6 +137,7 @@ def detect_lang() -> str:
         if val.lower().startswith("zh"):
             return "zh"
     try:
+        import locale
         loc = locale.getlocale()[0] or ""
         if loc.lower().startswith("zh"):
             return "zh"
@@ -141,12 +146,25 @@ def detect_lang() -> str:
     return "en"
 
 
-LANG = detect_lang()
+# Detected lazily on first use; see _strings()
+LANG = None
+_T = None
+
+
+def _strings() -> dict:
+    """Flattened table for the active language, with English as fallback."""
+    global LANG, _T
+    if _T is None:
+        if LANG is None:
+            LANG = detect_lang()
+        _T = dict(STRINGS["en"])
+        _T.update(STRINGS.get(LANG, {}))
+    return _T
 
 
 def t(key: str, **kwargs) -> str:
     """Get translated string."""
-    s = STRINGS.get(LANG, STRINGS["en"]).get(key, STRINGS["en"].get(key, key))
+    s = _strings().get(key, key)
     if kwargs:
         return s.format(**kwargs)
     return s
@@ -167,10 +185,23 @@ def get_chain_name(key: str) -> str:
     return ct["name"]
 
 
+@functools.lru_cache(maxsize=1)
+def chain_menu() -> str:
+    """Chain picker lines for cmd_add; fixed once the language is resolved."""
+    return "\n".join(f"  {k}. {get_chain_name(k)}" for k in CHAIN_TYPES)
+
+
 # ── Registry ─────────────────────────────────────────
 
-def get_registry() -> list:
-    data = keyring.get_password(SERVICE_ID, REGISTRY_KEY)
+def _keyring():
+    """Import keyring on first use; its backend setup is slow to load."""
+    import keyring
+    return keyring
+
+
+def read_registry() -> list:
+    """Read and parse the registry from the keychain (uncached)."""
+    data = _keyring().get_password(SERVICE_ID, REGISTRY_KEY)
     if not data:
         return []
     try:
@@ -182,19 +213,76 @@ def get_registry() -> list:
         return []
 
 
+@functools.lru_cache(maxsize=1)
+def load_registry() -> tuple:
+    """Cached (wallets, {alias: wallet}) for this CLI run; cleared by save_registry."""
+    wallets = read_registry()
+    return wallets, {w["alias"]: w for w in wallets}
+
+
+def get_registry() -> list:
+    return load_registry()[0]
+
+
 def save_registry(wallets: list):
-    keyring.set_password(SERVICE_ID, REGISTRY_KEY, json.dumps(wallets))
+    _keyring().set_password(SERVICE_ID, REGISTRY_KEY, json.dumps(wallets))
+    load_registry.cache_clear()
 
 
-def find_wallet(wallets, alias):
-    for w in wallets:
-        if w["alias"] == alias:
-            return w
-    return None
+# errSecItemNotFound as printed by `delete-generic-password`
+_ITEM_NOT_FOUND = "SecKeychainSearchCopyNext: The specified item could not be found in the keychain."
+
+
+def store_secret(alias: str, secret: str) -> subprocess.CompletedProcess:
+    """Write a keychain item with an empty trusted-app list (prompt on every read).
+
+    Any existing item is deleted first, in the same `security -i` session, so a
+    stale item's ACL (e.g. one that trusts Python) is never carried over. The
+    commands go in on stdin, so the secret never shows up in argv
+    (/proc/<pid>/cmdline, ps, process accounting).
+    """
+    def quote(v):
+        return '"' + v.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+    command = (
+        f"delete-generic-password -s {SERVICE_ID} -a {quote(alias)}\n"
+        f'add-generic-password -s {SERVICE_ID} -a {quote(alias)} -w {quote(secret)} -T ""\n'
+    )
+    try:
+        result = subprocess.run(
+            ["security", "-i"], input=command, capture_output=True, text=True
+        )
+    finally:
+        command = None
+        del command
+    # Interactive mode's exit status does not track each command, so also judge
+    # by stderr. Only the delete's "no such item" is expected (first add of an
+    # alias); any other message, e.g. a missing keychain, is a failure.
+    errors = [line for line in result.stderr.splitlines()
+              if line.strip() and line.strip() != _ITEM_NOT_FOUND]
+    result.stderr = "\n".join(errors)
+    if errors and result.returncode == 0:
+        result.returncode = 1
+    return result
 
 
 # ── Address Derivation ───────────────────────────────
 
+def blake2b_256(data: bytes) -> bytes:
+    """BLAKE2b-256 digest via libsodium (PyNaCl is already needed for Ed25519)."""
+    from nacl.bindings import crypto_generichash_blake2b_salt_personal
+    return crypto_generichash_blake2b_salt_personal(data, digest_size=32)
+
+
+def bech32_5to8(data5bit: list) -> bytes:
+    """Pack 5-bit groups into bytes; same as convertbits(data, 5, 8, False)."""
+    acc = 0
+    for v in data5bit:
+        acc = (acc << 5) | v
+    total_bits = len(data5bit) * 5
+    return (acc >> (total_bits & 7)).to_bytes(total_bits // 8, "big")
+
+
 def derive_sui_address(secret: str) -> str:
     try:
         import bech32
@@ -202,37 +290,43 @@ def derive_sui_address(secret: str) -> str:
 
         if secret.startswith("suiprivkey1"):
             hrp, data5bit = bech32.bech32_decode(secret)
-            data8bit = bytes(bech32.convertbits(data5bit, 5, 8, False))
+            data8bit = bech32_5to8(data5bit)
             scheme = data8bit[0]
             seed = data8bit[1:33]
         else:
             clean = secret.replace("0x", "")
             seed = bytes.fromhex(clean[:64])
             scheme = 0
+        if scheme >= len(_SCHEME_FLAG):
+            raise ValueError(f"unsupported key scheme flag {scheme}")
         sk = SigningKey(seed)
         pk = sk.verify_key.encode()
-        hasher = hashlib.blake2b(digest_size=32)
-        hasher.update(bytes([scheme]) + pk)
-        return "0x" + hasher.hexdigest()
+        return "0x" + blake2b_256(_SCHEME_FLAG[scheme] + pk).hex()
     except Exception as e:
         return f"(derive failed: {e})"
 
 
 def derive_evm_address(secret: str) -> str:
     try:
-        from cryptography.hazmat.primitives.asymmetric import ec
-        from cryptography.hazmat.backends import default_backend
         clean = secret.replace("0x", "")
-        private_key = ec.derive_private_key(int(clean, 16), ec.SECP256K1(), default_backend())
-        pub = private_key.public_key()
-        pub_bytes = pub.public_bytes(
-            encoding=__import__('cryptography').hazmat.primitives.serialization.Encoding.X962,
-            format=__import__('cryptography').hazmat.primitives.serialization.PublicFormat.UncompressedPoint
-        )
+        try:
+            # libsecp256k1 is much faster than the generic OpenSSL curve path
+            import coincurve
+            pub_bytes = coincurve.PublicKey.from_secret(
+                int(clean, 16).to_bytes(32, "big")
+            ).format(compressed=False)
+        except ImportError:
+            from cryptography.hazmat.primitives.asymmetric import ec
+            from cryptography.hazmat.backends import default_backend
+            private_key = ec.derive_private_key(int(clean, 16), ec.SECP256K1(), default_backend())
+            pub = private_key.public_key()
+            pub_bytes = pub.public_bytes(
+                encoding=__import__('cryptography').hazmat.primitives.serialization.Encoding.X962,
+                format=__import__('cryptography').hazmat.primitives.serialization.PublicFormat.UncompressedPoint
+            )
         try:
             from Crypto.Hash import keccak
-            k = keccak.new(digest_bits=256)
-            k.update(pub_bytes[1:])
+            k = keccak.new(digest_bits=256, data=pub_bytes[1:])
             return "0x" + k.hexdigest()[-40:]
         except ImportError:
             return "(need pycryptodome for EVM address)"
@@ -248,9 +342,21 @@ def derive_address(chain: str, secret: str) -> str:
     return ""
 
 
+def list_wallets_json() -> list:
+    """Registered wallets as plain dicts (alias, chain, address); no secrets."""
+    return [
+        {"alias": w["alias"], "chain": w.get("chain", ""), "address": w.get("address", "")}
+        for w in read_registry()
+    ]
+
+
 # ── Commands ─────────────────────────────────────────
 
-def cmd_list():
+def cmd_list(as_json: bool = False):
+    if as_json:
+        print(json.dumps(list_wallets_json(), ensure_ascii=False))
+        return
+
     wallets = get_registry()
     if not wallets:
         print(t("no_wallets"))
@@ -278,8 +384,8 @@ def cmd_add():
         print(t("invalid_alias"))
         return
 
-    wallets = get_registry()
-    existing = find_wallet(wallets, alias)
+    wallets, by_alias = load_registry()
+    existing = by_alias.get(alias)
     if existing:
         overwrite = input(t("exists_overwrite", alias=alias)).lower()
         if overwrite != 'y':
@@ -287,8 +393,7 @@ def cmd_add():
             return
 
     print(f"\n{t('chain_type')}")
-    for k in ["1", "2", "3", "4"]:
-        print(f"  {k}. {get_chain_name(k)}")
+    print(chain_menu())
     chain_choice = input(t("chain_select")).strip() or "4"
     chain_id = CHAIN_TYPES.get(chain_choice, CHAIN_TYPES["4"])["id"]
 
@@ -311,37 +416,50 @@ def cmd_add():
             if input(t("continue_yn")).lower() != 'y':
                 return
 
-    address = derive_address(chain_id, secret)
+    # Re-adding the same key on the same chain: reuse the stored address.
+    # Only sui/evm derive addresses, and only a real one ("0x...", not an
+    # error note like "(derive failed: ...)") is worth fingerprinting.
+    fp = None
+    address = None
+    if chain_id in ("sui", "evm"):
+        fp = hashlib.blake2b(secret.encode(), digest_size=8).hexdigest()
+        if (existing and existing.get("chain") == chain_id and existing.get("fp") == fp
+                and existing.get("address", "").startswith("0x")):
+            address = existing["address"]
+    if address is None:
+        address = derive_address(chain_id, secret)
+    if not address.startswith("0x"):
+        fp = None
     if address:
         print(f"\n{t('derived_addr', addr=address)}")
 
     try:
-        subprocess.run(
-            ["security", "delete-generic-password", "-s", SERVICE_ID, "-a", alias],
-            capture_output=True
-        )
-        result = subprocess.run(
-            ["security", "add-generic-password", "-s", SERVICE_ID, "-a", alias, "-w", secret, "-T", ""],
-            capture_output=True, text=True
-        )
+        result = store_secret(alias, secret)
         if result.returncode != 0:
             print(t("store_fail", err=result.stderr))
             return
 
-        if existing:
-            existing["chain"] = chain_id
-            existing["address"] = address
+        record = existing if existing else {"alias": alias}
+        record["chain"] = chain_id
+        record["address"] = address
+        if fp:
+            record["fp"] = fp
         else:
-            wallets.append({"alias": alias, "chain": chain_id, "address": address})
+            record.pop("fp", None)
+        if not existing:
+            wallets.append(record)
         save_registry(wallets)
         print(f"\n{t('store_ok', alias=alias)}")
     except Exception as e:
         print(t("store_fail", err=str(e)))
+    finally:
+        secret = None
+        del secret
 
 
 def cmd_remove(alias: str):
-    wallets = get_registry()
-    existing = find_wallet(wallets, alias)
+    wallets, by_alias = load_registry()
+    existing = by_alias.get(alias)
     if not existing:
         print(t("remove_not_found", alias=alias))
         return
@@ -352,7 +470,7 @@ def cmd_remove(alias: str):
         return
 
     try:
-        keyring.delete_password(SERVICE_ID, alias)
+        _keyring().delete_password(SERVICE_ID, alias)
         wallets.remove(existing)
         save_registry(wallets)
         print(t("remove_ok", alias=alias))
@@ -362,13 +480,13 @@ def cmd_remove(alias: str):
 
 def cmd_test(alias: str):
     print(f"\n{t('test_title', alias=alias)}")
-    wallets = get_registry()
-    w = find_wallet(wallets, alias)
+    _, by_alias = load_registry()
+    w = by_alias.get(alias)
     if w:
         print(t("test_chain", chain=w.get("chain", "?").upper()))
         print(t("test_addr", addr=w.get("address", "N/A")))
     try:
-        pk = keyring.get_password(SERVICE_ID, alias)
+        pk = _keyring().get_password(SERVICE_ID, alias)
         if pk:
             print(t("test_ok", n=len(pk)))
         else:
@@ -378,8 +496,8 @@ def cmd_test(alias: str):
 
 
 def cmd_reset_acl(alias: str):
-    wallets = get_registry()
-    w = find_wallet(wallets, alias)
+    _, by_alias = load_registry()
+    w = by_alias.get(alias)
     if not w:
         print(t("remove_not_found", alias=alias))
         return
@@ -387,20 +505,13 @@ def cmd_reset_acl(alias: str):
     print(f"\n{t('acl_title', alias=alias)}")
     print(t("acl_desc"))
 
-    pk = keyring.get_password(SERVICE_ID, alias)
+    pk = _keyring().get_password(SERVICE_ID, alias)
     if not pk:
         print(t("acl_read_fail"))
         return
 
     try:
-        subprocess.run(
-            ["security", "delete-generic-password", "-s", SERVICE_ID, "-a", alias],
-            capture_output=True
-        )
-        result = subprocess.run(
-            ["security", "add-generic-password", "-s", SERVICE_ID, "-a", alias, "-w", pk, "-T", ""],
-            capture_output=True, text=True
-        )
+        result = store_secret(alias, pk)
         if result.returncode != 0:
             print(t("acl_fail", err=result.stderr))
             return
@@ -432,10 +543,11 @@ def main():
     parser = argparse.ArgumentParser(description=t("panel_title"))
     parser.add_argument('command', choices=['list', 'add', 'remove', 'test', 'reset-acl', 'export-config'])
     parser.add_argument('name', nargs='?', help='Wallet alias')
+    parser.add_argument('--json', action='store_true', help='list: print wallets as JSON')
     args = parser.parse_args()
 
     if args.command == 'list':
-        cmd_list()
+        cmd_list(as_json=args.json)
     elif args.command == 'add':
         cmd_add()
     elif args.command == 'remove':